@@ -1,41 +1,91 @@
 #!/usr/bin/env python3
 
-import json
+import orjson
 from flask import (
     Flask,
+    Response,
     render_template,
-    jsonify,
+    make_response,
     request, 
 )
+from flask.json.provider import DefaultJSONProvider
 from generator import (
     WORKOUT_TYPES, DIFFICULTIES,
     generate_rowing_workout,
 )
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    @staticmethod
+    def default(o):
+        # orjson rejects tuple subclasses such as WorkoutSet; stdlib emits arrays
+        if isinstance(o, tuple):
+            return list(o)
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # --- Configuration ---
 # Set the desired interval time in minutes
 
 # ---------------------
 
-@app.route('/', methods=['GET'])
-def index():
-    dropdown_options = {
-        'task_type': WORKOUT_TYPES,
-        'difficulty': DIFFICULTIES
-    }
+# Static inputs for the landing page, built once rather than per request
+_DROPDOWN_OPTIONS = {
+    'task_type': WORKOUT_TYPES,
+    'difficulty': DIFFICULTIES
+}
+_INITIAL_MESSAGE = "Set your task details and total time, then press 'Set Timer'."
+_INITIAL_INTERVAL_MESSAGE = "Interval insructions will be displayed here."
 
-    initial_message = "Set your task details and total time, then press 'Set Timer'."
-    initial_interval_message = "Interval insructions will be displayed here."
+# Pre-serialized body for the most common validation failure
+_ERR_MIN_TIME = app.json.dumps({
+    'success': False,
+    'message': "Error: Minimum workout time of 15 minutes. "
+               "Please enter a valid positive number for 'Total Time'."
+})
 
+
+def _json_response(obj, status=200):
+    """Serializes obj with the app's JSON provider into a JSON response."""
+    response = app.json.response(obj)
+    response.status_code = status
+    return response
+
+
+# The landing page only depends on the constants above, so it is rendered on
+# the first request and reused. Rendering inside a real request lets url_for()
+# pick up the deployment's SCRIPT_NAME; the cached page assumes the app is
+# served under a single prefix.
+_index_html = None
+
+
+@app.route('/', methods=['GET'])
+def index():
     # This block handles the initial GET request to load the page
-    return render_template(
-        'index.html', 
-        options=dropdown_options, 
-        message=initial_message,
-        interval_message=initial_interval_message
-    )
+    global _index_html
+    if _index_html is None or app.debug: # re-render so template edits show up
+        _index_html = render_template(
+            'index.html', 
+            options=_DROPDOWN_OPTIONS, 
+            message=_INITIAL_MESSAGE,
+            interval_message=_INITIAL_INTERVAL_MESSAGE
+        )
+    response = make_response(_index_html)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 
 @app.route('/dashboard', methods=['POST'])
@@ -51,18 +101,18 @@ def dashboard():
         # Simple validation
         try:
             total_time_minutes = int(total_time_minutes)
-            if total_time_minutes < 15:
-                raise ValueError("Minimum workout time of 15 minutes.")
-            if total_time_minutes > 240:
-                total_time_minutes = 240
         except (ValueError, TypeError) as e:
             error_message = f"Error: {e}. Please enter a valid positive number for 'Total Time'."
-            return jsonify({'success': False, 'message': error_message})
+            return _json_response({'success': False, 'message': error_message})
+        if total_time_minutes < 15:
+            return Response(_ERR_MIN_TIME, mimetype=app.json.mimetype)
+        if total_time_minutes > 240:
+            total_time_minutes = 240
 
         workout_intervals = generate_rowing_workout(
             task_type, difficulty, total_time_minutes
         )
-        workout_details = json.dumps(workout_intervals)
+        workout_details = app.json.dumps(workout_intervals)
     
     return render_template('dashboard.html',
                            total_time_seconds = total_time_minutes *60,
@@ -1,13 +1,25 @@
+import functools
 import random
-from typing import Any
-import numpy as np
+from typing import NamedTuple
 
-# (set_name, time_minutes, stroke_rate, resistance_level)
-WorkoutSet = tuple[str, float, int, int]
+
+class WorkoutSet(NamedTuple):
+    """A single timed set: name, duration in seconds, stroke rate, resistance."""
+    name: str
+    seconds: int
+    spm: int
+    resistance: int
+
+
+# (sets, total_seconds) returned by each main-set generator
+MainSets = tuple[list[WorkoutSet], int]
 
 WARMUP_SPM = 18
 REST_SPM = 20
 
+# Standard 5 minute warm-up, shared by every workout long enough to use it
+_WARMUP_SET = WorkoutSet("Warm-up", 300, WARMUP_SPM, 2)
+
 WORKOUT_TYPES = [
     'Cardio 🫀',
     'Interval ⏳',
@@ -23,74 +35,98 @@ DIFFICULTIES = [
     'Hard 😖'
 ]
 
+_PYRAMID_PATTERNS = ('12321', '1234321')
+
+# Intensity level of each step in a pyramid pattern
+_PYRAMID_LEVELS = {
+    pattern: tuple(int(c) for c in pattern)
+    for pattern in _PYRAMID_PATTERNS
+}
+
+# Normalized work-time weights for each pyramid pattern. Plain tuples beat
+# NumPy arrays at this size (<= 7 elements), where dispatch dominates.
+_PYRAMID_WEIGHTS = {
+    pattern: tuple(level / sum(levels) for level in levels)
+    for pattern, levels in _PYRAMID_LEVELS.items()
+}
+
+# Work period names, formatted once per pattern instead of on every request
+_PYRAMID_NAMES = {
+    pattern: tuple(
+        f'Work Interval {i+1}/{len(pattern)}' for i in range(len(pattern))
+    )
+    for pattern in _PYRAMID_PATTERNS
+}
+
+
+# (spm, resistance) base parameters per difficulty
+_INTENSITY = {
+    'Easy 🥱': (22, 4),
+    'Medium 😎': (24, 5),
+    'Hard 😖': (26, 6),
+}
+_DEFAULT_INTENSITY = (24, 5)
 
-def get_intensity_params(difficulty: str) -> dict[str, Any]:
+
+def get_intensity_params(difficulty: str) -> tuple[int, int]:
     """Returns base parameters (SPM, Resistance) based on difficulty."""
-    match difficulty:
-        case 'Easy 🥱':
-            return {'spm': 22, 'resistance': 4}
-        case 'Medium 😎':
-            return {'spm': 24, 'resistance': 5}
-        case 'Hard 😖':
-            return {'spm': 26, 'resistance': 6}
-        case _:
-            return {'spm': 24, 'resistance': 5} # Default
+    return _INTENSITY.get(difficulty, _DEFAULT_INTENSITY)
 
 
 def generate_endurance_workout(
     main_time: int | float,
     difficulty: str
-) -> list[WorkoutSet]:
+) -> MainSets:
     """Generates a steady-state endurance workout."""
-    params = get_intensity_params(difficulty)
-    spm = params['spm']
-    resistance = params['resistance']
-    return [("Steady State Row", main_time*60, spm, resistance)]
+    spm, resistance = get_intensity_params(difficulty)
+    main_seconds = int(main_time*60)
+    return [WorkoutSet("Steady State Row", main_seconds, spm, resistance)], main_seconds
 
 
 def generate_interval_workout(
     main_time: int | float,
     difficulty: str
-) -> list[WorkoutSet]:
+) -> MainSets:
     """Generates a high-intensity interval training (HIIT) workout."""
-    params = get_intensity_params(difficulty)
-    work_spm = params['spm'] + 4 # Higher SPM for max effort
-    base_resistance = params['resistance']
+    base_spm, base_resistance = get_intensity_params(difficulty)
+    work_spm = base_spm + 4 # Higher SPM for max effort
     
-    # Adjust work/rest ratio based on difficulty
-    work_duration = 1.0 # 1 minute
+    # Adjust work/rest ratio (in seconds) based on difficulty
+    work_seconds = 60 # 1 minute
     
     match difficulty:
         case 'Easy 🥱':
-            rest_duration = 1.5 # Longer rest period
+            rest_seconds = 90 # Longer rest period
         case 'Medium 😎':
-            work_duration = 1.5 # Longer work period
+            work_seconds = 90 # Longer work period
         case 'Hard 😖':
-            rest_duration = 0.5 # Shorter rest for hard
+            rest_seconds = 30 # Shorter rest for hard
 
-    num_cycles = int(main_time // (work_duration + rest_duration))
-    
-    workout = []
-    for i in range(num_cycles):
-        workout.append(
-            (f"Work Interval {i+1}/{num_cycles}", work_duration*60, work_spm, base_resistance)
-        )
-        workout.append(
-            (f"Rest Interval {i+1}/{num_cycles}", rest_duration*60, REST_SPM, base_resistance)
+    num_cycles = int(main_time*60 // (work_seconds + rest_seconds))
+
+    workout = [
+        set_
+        for i in range(num_cycles)
+        for set_ in (
+            WorkoutSet(f"Work Interval {i+1}/{num_cycles}", work_seconds, work_spm, base_resistance),
+            WorkoutSet(f"Rest Interval {i+1}/{num_cycles}", rest_seconds, REST_SPM, base_resistance),
         )
+    ]
 
     # Account for any time left over
-    remaining_time = main_time - sum(set_[1] for set_ in workout)
-    if remaining_time < (rest_duration + work_duration):
-         workout.append(("Final Easy Row", remaining_time*60, REST_SPM, 5))
+    used_seconds = num_cycles * (work_seconds + rest_seconds)
+    remaining_time = int(main_time*60) - used_seconds
+    if remaining_time > 0:
+         workout.append(WorkoutSet("Final Easy Row", remaining_time, REST_SPM, 5))
+         used_seconds += remaining_time
 
-    return workout
+    return workout, used_seconds
 
 
 def generate_rate_pyramid_workout(
     main_time: int | float,
     difficulty: str,
-) -> list[WorkoutSet]:
+) -> MainSets:
     """Generates a pyramid workout that increases, then decreses in intensity"""
     if main_time < 20:
         pattern = '12321'
@@ -105,32 +141,32 @@ def generate_rate_pyramid_workout(
         case 'Hard 😖':
             multiplier = 1.9
 
-    n_segments = len(pattern) * 2
-    segment_time = main_time / n_segments
-    base = get_intensity_params(difficulty)
-    rest_period = ('Rest', int(segment_time*60), REST_SPM, base['resistance'])
-
-    workout = []
-    for i, interval in enumerate(pattern):
-
-        interval_num = int(interval)
-        work_period = (
-            f'Work Interval {i+1}/{len(pattern)}',
-            int(segment_time*60),
-            int(base['spm'] + interval_num*multiplier),
-            base['resistance']
+    n_intervals = len(pattern)
+    segment_seconds = int(main_time / (n_intervals * 2) * 60)
+    spm, resistance = get_intensity_params(difficulty)
+    rest_period = WorkoutSet('Rest', segment_seconds, REST_SPM, resistance)
+
+    workout = [
+        set_
+        for name, level in zip(_PYRAMID_NAMES[pattern], _PYRAMID_LEVELS[pattern])
+        for set_ in (
+            WorkoutSet(
+                name,
+                segment_seconds,
+                int(spm + level*multiplier),
+                resistance
+            ),
+            rest_period,
         )
+    ]
 
-        workout.append(work_period)
-        workout.append(rest_period)
-
-    return workout
+    return workout, segment_seconds * n_intervals * 2
 
 
 def generate_time_pyramid_workout(
     main_time: int | float,
     difficulty: str,
-) -> list[WorkoutSet]:
+) -> MainSets:
     """Generates a pyramid workout that increases, then decreses in intensity"""
     if main_time < 20:
         pattern = '12321'
@@ -139,102 +175,106 @@ def generate_time_pyramid_workout(
 
     match difficulty:
         case 'Easy 🥱':
-            rest_duration = 0.75
+            rest_seconds = 45
         case 'Medium 😎':
-            rest_duration = 0.5
+            rest_seconds = 30
         case 'Hard 😖':
-            rest_duration = 0.5
-
-    base = get_intensity_params(difficulty)
-    rest_period = ('Rest', rest_duration*60, REST_SPM, base['resistance'])
-
-    nonrest_time = main_time - rest_duration * len(pattern)
-    pattern_num = np.array(list(pattern)).astype(int)
-    interval_times = pattern_num/pattern_num.sum() * nonrest_time
-
-    workout = []
-    for i, time in enumerate(interval_times):
-
-        work_period = (
-            f'Work Interval {i+1}/{len(interval_times)}',
-            int(time*60),
-            base['spm'] + 4,
-            base['resistance']
+            rest_seconds = 30
+
+    base_spm, resistance = get_intensity_params(difficulty)
+    rest_period = WorkoutSet('Rest', rest_seconds, REST_SPM, resistance)
+
+    nonrest_time = main_time - rest_seconds/60 * len(pattern)
+    interval_times = [
+        weight * nonrest_time for weight in _PYRAMID_WEIGHTS[pattern]
+    ]
+
+    n_intervals = len(interval_times)
+    work_seconds = [int(time*60) for time in interval_times]
+    work_spm = base_spm + 4
+
+    workout = [
+        set_
+        for name, seconds in zip(_PYRAMID_NAMES[pattern], work_seconds)
+        for set_ in (
+            WorkoutSet(name, seconds, work_spm, resistance),
+            rest_period,
         )
+    ]
 
-        workout.append(work_period)
-        workout.append(rest_period)
-
-    return workout
+    return workout, sum(work_seconds) + rest_seconds * n_intervals
 
 
 def generate_strength_workout(
     main_time: int | float,
     difficulty: str
-) -> list[WorkoutSet]:
+) -> MainSets:
     """Generates a low-rate, high-force strength workout."""
     power_spm = 24
     
     match difficulty:
         case 'Easy 🥱':
             high_resistance = 6 # Slightly lower resistance for easier adaptation
-            rep_duration, rest_duration = 0.5, 1.0
+            rep_seconds, rest_seconds = 30, 60
         case 'Medium 😎':
             high_resistance = 7
-            rep_duration, rest_duration = 0.5, 1.0
+            rep_seconds, rest_seconds = 30, 60
         case 'Hard 😖':
             high_resistance = 8
-            rep_duration, rest_duration = 1.0, 1.0
+            rep_seconds, rest_seconds = 60, 60
 
-    num_sets = int(main_time // (rep_duration + rest_duration))
-    
-    workout = []
-    for i in range(num_sets):
-        workout.append(
-            (f"Power Pull {i+1}", rep_duration*60, power_spm, high_resistance)
-        )
-        workout.append(
-            (f"Active Recovery {i+1}", rest_duration*60, REST_SPM-2, 5)
+    num_sets = int(main_time*60 // (rep_seconds + rest_seconds))
+    recovery_spm = REST_SPM - 2
+
+    workout = [
+        set_
+        for i in range(num_sets)
+        for set_ in (
+            WorkoutSet(f"Power Pull {i+1}", rep_seconds, power_spm, high_resistance),
+            WorkoutSet(f"Active Recovery {i+1}", rest_seconds, recovery_spm, 5),
         )
+    ]
+
+    return workout, num_sets * (rep_seconds + rest_seconds)
 
-    return workout
+
+_SURPRISE_GENERATORS = (
+    generate_endurance_workout,
+    generate_interval_workout,
+    generate_strength_workout,
+)
 
 
 def generate_surprise_workout(
     main_time: int | float,
     difficulty: str
-) -> list[WorkoutSet]:
+) -> MainSets:
     """Generates a random mix of endurance, interval, and cardio sets."""
-    workouts_available = [generate_endurance_workout, generate_interval_workout, generate_strength_workout]
-    
     # Split the main time into 3-5 segments and assign a random workout type
     num_segments = random.randint(3, 6)
     segment_time = main_time / num_segments
+    generators = random.choices(_SURPRISE_GENERATORS, k=num_segments)
     
     workout = []
-    for i in range(num_segments):
-        generator = random.choice(workouts_available)
-        segment_sets = generator(segment_time, difficulty)
+    total_seconds = 0
+    for i, generator in enumerate(generators):
+        segment_sets, segment_seconds = generator(segment_time, difficulty)
+        total_seconds += segment_seconds
         # Rename segments to reflect the overall 'Surprise' theme
-        for set_name, time, spm, res in segment_sets:
-             workout.append((f"Surprise Segment {i+1}: {set_name}", time, spm, res))
+        for set_ in segment_sets:
+             workout.append(
+                 set_._replace(name=f"Surprise Segment {i+1}: {set_.name}")
+             )
 
-    return workout
+    return workout, total_seconds
 
 
-def generate_rowing_workout(
+def _build_workout(
     workout_type: str,
     difficulty: str,
     total_time_minutes: int
 ) -> list[WorkoutSet]:
-    """
-    Generates a structured rowing workout pattern using dedicated functions 
-    and returns a list of tuples.
-    """
-    # 1. Input Validation and Time Allocation
-    if total_time_minutes < 15:
-        raise ValueError("Total workout time must be at least 15 minutes.")
-    
+    """Builds the full warm-up, main set and cool-down workout."""
     warmup_time = cooldown_time = 5.0
     main_time = total_time_minutes - warmup_time - cooldown_time
 
@@ -243,28 +283,72 @@ def generate_rowing_workout(
         warmup_time = total_time_minutes / 4
         cooldown_time = total_time_minutes / 4
 
-    # 2. Main Workout Generation using match/case
+    # Main Workout Generation using match/case
     match workout_type:
         case 'Cardio 🫀':
-            main_sets = generate_endurance_workout(main_time, difficulty)
+            main_sets, main_set_times = generate_endurance_workout(
+                main_time, difficulty
+            )
         case 'Interval ⏳':
-            main_sets = generate_interval_workout(main_time, difficulty)
+            main_sets, main_set_times = generate_interval_workout(
+                main_time, difficulty
+            )
         case 'Pyramid-SPM 📶':
-            main_sets = generate_rate_pyramid_workout(main_time, difficulty)
+            main_sets, main_set_times = generate_rate_pyramid_workout(
+                main_time, difficulty
+            )
         case 'Pyramid-Time ⏱️':
-            main_sets = generate_time_pyramid_workout(main_time, difficulty)
+            main_sets, main_set_times = generate_time_pyramid_workout(
+                main_time, difficulty
+            )
         case 'Strength 💪':
-            main_sets = generate_strength_workout(main_time, difficulty)
+            main_sets, main_set_times = generate_strength_workout(
+                main_time, difficulty
+            )
         case 'Surprise 🎱':
-            main_sets = generate_surprise_workout(main_time, difficulty)
+            main_sets, main_set_times = generate_surprise_workout(
+                main_time, difficulty
+            )
         case _:
             raise ValueError(f"Unknown workout type: {workout_type}.")
     
     # Warm-up and cool-down (Low SPM, Low Resistance)
-    warmup_set = ("Warm-up", warmup_time*60, WARMUP_SPM, 2)
-    main_set_times = sum([x[1] for x in main_sets])
+    if warmup_time == 5.0:
+        warmup_set = _WARMUP_SET
+    else:
+        warmup_set = WorkoutSet("Warm-up", int(warmup_time*60), WARMUP_SPM, 2)
     extra_cooldown_time = int(total_time_minutes*60 - main_set_times - warmup_time*60)
-    cooldown_set = ("Cool-down", extra_cooldown_time, WARMUP_SPM, 2)
+    cooldown_set = WorkoutSet("Cool-down", extra_cooldown_time, WARMUP_SPM, 2)
     
     return [warmup_set] + main_sets + [cooldown_set]
 
+
+@functools.lru_cache(maxsize=4096)
+def _generate_cached(
+    workout_type: str,
+    difficulty: str,
+    total_time_minutes: int
+) -> tuple[WorkoutSet, ...]:
+    """Memoized workout for the deterministic (non-Surprise) workout types."""
+    # Stored as a tuple so the cached entry can't be mutated by callers
+    return tuple(_build_workout(workout_type, difficulty, total_time_minutes))
+
+
+def generate_rowing_workout(
+    workout_type: str,
+    difficulty: str,
+    total_time_minutes: int
+) -> list[WorkoutSet]:
+    """
+    Generates a structured rowing workout pattern using dedicated functions 
+    and returns a list of tuples.
+    """
+    # 1. Input Validation and Time Allocation
+    if total_time_minutes < 15:
+        raise ValueError("Total workout time must be at least 15 minutes.")
+
+    # 2. Surprise workouts are random, and unknown difficulties would let raw
+    # form input flood the cache; everything else can be served from cache
+    if workout_type == 'Surprise 🎱' or difficulty not in DIFFICULTIES:
+        return _build_workout(workout_type, difficulty, total_time_minutes)
+    return list(_generate_cached(workout_type, difficulty, total_time_minutes))
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point. Run with preloading so the app and generator tables are
+imported once in the parent and shared copy-on-write by the forked workers:
+
+    gunicorn --preload -w 4 wsgi:app
+"""
+
+from app import app
+
+__all__ = ['app']